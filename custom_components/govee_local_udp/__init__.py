@@ -11,8 +11,16 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import CONF_TEMP_ONLY_MODE, DISCOVERY_TIMEOUT, DOMAIN
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_FORCED_IP_ADDRESSES,
+    CONF_TEMP_ONLY_MODE,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+    FORCED_IP_TIMEOUT,
+    STORAGE_VERSION,
+)
 from .coordinator import GoveeLocalUdpCoordinator
 from .protocol.controller import LISTENING_PORT
 
@@ -42,7 +50,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         """Wait for cleanup to complete."""
         cleanup_complete = coordinator.cleanup()
         with suppress(TimeoutError):
-            await asyncio.wait_for(cleanup_complete.wait(), 1)
+            async with asyncio.timeout(1):
+                await cleanup_complete.wait()
 
     entry.async_on_unload(await_cleanup)
 
@@ -55,18 +64,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Port %s already in use", LISTENING_PORT)
         raise ConfigEntryNotReady from ex
 
+    # Refresh before forwarding, so a ConfigEntryNotReady from the refresh
+    # cannot leave a forward in flight that the setup retry would repeat
     await coordinator.async_config_entry_first_refresh()
 
+    # Set up the platforms while discovery is in flight; the light platform
+    # adds entities for devices discovered after it is set up
+    platforms_task = hass.async_create_task(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    )
+
     # Wait for at least one device to be discovered
+    timeout = (
+        FORCED_IP_TIMEOUT
+        if entry.data.get(CONF_FORCED_IP_ADDRESSES)
+        else DISCOVERY_TIMEOUT
+    )
     try:
-        async with asyncio.timeout(DISCOVERY_TIMEOUT):
-            while not coordinator.devices:
-                await asyncio.sleep(1)
+        async with asyncio.timeout(timeout):
+            await coordinator.async_wait_for_first_device()
     except TimeoutError as ex:
         _LOGGER.warning("No devices found during setup. Integration will continue "
                        "looking for devices in the background.")
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await platforms_task
     return True
 
 
@@ -76,4 +97,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached device addresses when the entry is deleted."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-import ipaddress
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -16,6 +16,35 @@ from .const import CONF_TEMP_ONLY_MODE, CONF_FORCED_IP_ADDRESSES, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Octets without leading zeros, inet_aton would read "010" as octal
+_IPV4_RE = re.compile(
+    r"(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+)
+
+STEP_USER_SCHEMA = vol.Schema({vol.Optional(CONF_FORCED_IP_ADDRESSES): str})
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TEMP_ONLY_MODE): bool,
+        vol.Optional(CONF_FORCED_IP_ADDRESSES): str,
+    }
+)
+
+
+def _parse_ip_addresses(value: str) -> tuple[list[str], bool]:
+    """Split comma-separated IPv4 addresses and report whether all were valid.
+
+    Duplicates are dropped, keeping the first occurrence.
+    """
+    ip_addresses = []
+    valid = True
+    for ip in dict.fromkeys(filter(None, map(str.strip, value.split(",")))):
+        if _IPV4_RE.fullmatch(ip):
+            ip_addresses.append(ip)
+        else:
+            valid = False
+    return ip_addresses, valid
+
 
 class GoveeLocalUdpFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Govee Local UDP."""
@@ -33,13 +62,9 @@ class GoveeLocalUdpFlowHandler(ConfigFlow, domain=DOMAIN):
             # Extract and validate the forced IP addresses if provided
             ip_addresses = []
             if forced_ips := user_input.get(CONF_FORCED_IP_ADDRESSES):
-                for ip in [ip.strip() for ip in forced_ips.split(",")]:
-                    if ip:
-                        try:
-                            ipaddress.ip_address(ip)
-                            ip_addresses.append(ip)
-                        except ValueError:
-                            errors[CONF_FORCED_IP_ADDRESSES] = "invalid_ip_address"
+                ip_addresses, valid = _parse_ip_addresses(forced_ips)
+                if not valid:
+                    errors[CONF_FORCED_IP_ADDRESSES] = "invalid_ip_address"
             
             # If no errors, create the config entry
             if not errors:
@@ -55,9 +80,7 @@ class GoveeLocalUdpFlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Optional(CONF_FORCED_IP_ADDRESSES): str,
-            }),
+            data_schema=STEP_USER_SCHEMA,
             errors=errors,
             description_placeholders={
                 "note": "Discovery will automatically search for Govee devices on your network. If your devices aren't discovered, you can specify their IP addresses here (comma-separated, e.g., 192.168.1.100, 192.168.1.101)."
@@ -86,13 +109,9 @@ class OptionsFlowHandler(OptionsFlow):
             # Extract and validate the forced IP addresses if provided
             ip_addresses = []
             if forced_ips := user_input.get(CONF_FORCED_IP_ADDRESSES):
-                for ip in [ip.strip() for ip in forced_ips.split(",")]:
-                    if ip:
-                        try:
-                            ipaddress.ip_address(ip)
-                            ip_addresses.append(ip)
-                        except ValueError:
-                            errors[CONF_FORCED_IP_ADDRESSES] = "invalid_ip_address"
+                ip_addresses, valid = _parse_ip_addresses(forced_ips)
+                if not valid:
+                    errors[CONF_FORCED_IP_ADDRESSES] = "invalid_ip_address"
             
             # If no errors, update the config entry
             if not errors:
@@ -110,15 +129,14 @@ class OptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_TEMP_ONLY_MODE,
-                    default=self.config_entry.options.get(CONF_TEMP_ONLY_MODE, False),
-                ): bool,
-                vol.Optional(
-                    CONF_FORCED_IP_ADDRESSES,
-                    default=ip_string,
-                ): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
+                {
+                    CONF_TEMP_ONLY_MODE: self.config_entry.options.get(
+                        CONF_TEMP_ONLY_MODE, False
+                    ),
+                    CONF_FORCED_IP_ADDRESSES: ip_string,
+                },
+            ),
             errors=errors,
         )
\ No newline at end of file
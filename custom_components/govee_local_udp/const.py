@@ -14,9 +14,19 @@ CONF_FORCED_IP_ADDRESSES = "forced_ip_addresses"
 
 # Timeouts and intervals
 SCAN_INTERVAL = timedelta(seconds=5)
-DISCOVERY_TIMEOUT = 10
+MAX_SCAN_INTERVAL = timedelta(seconds=CONF_DISCOVERY_INTERVAL_DEFAULT)
+DISCOVERY_TIMEOUT = 3
+FORCED_IP_TIMEOUT = 8  # Unicast probes to forced IPs may take longer to answer
 STATUS_TIMEOUT = 5
 
 
+# Storage for the last known IP address of each device
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+CACHED_IP_TIMEOUT = 300  # Forget cached devices that have not answered by then
+
 # Configuration options
-CONF_TEMP_ONLY_MODE = "temperature_only_mode"  # To force a light to only use temperature mode
\ No newline at end of file
+CONF_TEMP_ONLY_MODE = "temperature_only_mode"  # To force a light to only use temperature mode
+
+# Dispatcher signal sent when options change, formatted with the entry ID
+SIGNAL_OPTIONS_UPDATED = f"{DOMAIN}_options_updated_{{}}"
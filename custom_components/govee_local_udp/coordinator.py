@@ -5,27 +5,37 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable
-from typing import List
+from typing import Any, Dict, Tuple
 
+from homeassistant.components import network
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    CACHED_IP_TIMEOUT,
     CONF_DISCOVERY_INTERVAL_DEFAULT,
     CONF_FORCED_IP_ADDRESSES,
     CONF_LISTENING_PORT_DEFAULT,
     CONF_MULTICAST_ADDRESS_DEFAULT,
     CONF_TARGET_PORT_DEFAULT,
+    CONF_TEMP_ONLY_MODE,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     SCAN_INTERVAL,
+    SIGNAL_OPTIONS_UPDATED,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
 from .protocol.controller import GoveeController, GoveeLocalDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class GoveeLocalUdpCoordinator(DataUpdateCoordinator[List[GoveeLocalDevice]]):
+class GoveeLocalUdpCoordinator(DataUpdateCoordinator[Tuple[GoveeLocalDevice, ...]]):
     """Coordinator for Govee Local UDP integration."""
 
     config_entry: ConfigEntry
@@ -37,30 +47,49 @@ class GoveeLocalUdpCoordinator(DataUpdateCoordinator[List[GoveeLocalDevice]]):
             logger=_LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Devices push their own state changes, so only notify listeners
+            # when the set of devices changes
+            always_update=False,
         )
         
         self.config_entry = config_entry
-        self._device_callbacks = {}
+        self._loop = hass.loop
+        self.temperature_only_mode: bool = config_entry.options.get(
+            CONF_TEMP_ONLY_MODE, False
+        )
+        self._discovery_callback: Callable[[GoveeLocalDevice, bool], bool] | None = None
+        self._first_device_event = asyncio.Event()
+        self._last_states: Tuple[Any, ...] = ()
+        self._store: Store[Dict[str, str]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}"
+        )
+        self._cached_ips: Dict[str, str] = {}
+        # Immutable view of the controller's devices, rebuilt only when the
+        # set of devices changes
+        self._devices_snapshot: Tuple[GoveeLocalDevice, ...] = ()
         
         # Check if forced IP addresses were provided
         forced_ips = config_entry.data.get(CONF_FORCED_IP_ADDRESSES, [])
+        self._forced_ips = frozenset(forced_ips)
         
         self._controller = GoveeController(
-            loop=hass.loop,
+            loop=self._loop,
             logger=_LOGGER,
             broadcast_address=CONF_MULTICAST_ADDRESS_DEFAULT,
             broadcast_port=CONF_TARGET_PORT_DEFAULT,
             listening_port=CONF_LISTENING_PORT_DEFAULT,
             discovery_enabled=True,
             discovery_interval=CONF_DISCOVERY_INTERVAL_DEFAULT,
-            discovered_callback=None,
-            update_enabled=True,
+            discovered_callback=self._device_discovered,
+            evicted_callback=self._device_evicted,
+            # Status polling is driven by the coordinator's adaptive interval
+            update_enabled=False,
         )
         
         # Add any forced IPs to the discovery queue
         if forced_ips:
             for ip in forced_ips:
-                _LOGGER.debug(f"Adding forced IP to discovery queue: {ip}")
+                _LOGGER.debug("Adding forced IP to discovery queue: %s", ip)
                 self._controller.add_device_to_queue(ip)
         
         # Register update listener for configuration changes
@@ -70,13 +99,89 @@ class GoveeLocalUdpCoordinator(DataUpdateCoordinator[List[GoveeLocalDevice]]):
 
     async def start(self) -> None:
         """Start the coordinator."""
+        # Probe the last known device addresses directly, they usually answer
+        # before the multicast scan does
+        self._cached_ips = await self._store.async_load() or {}
+        for ip in self._cached_ips.values():
+            self._controller.add_device_to_queue(ip)
+        if self._cached_ips:
+            self.config_entry.async_on_unload(
+                async_call_later(self.hass, CACHED_IP_TIMEOUT, self._prune_cached_ips)
+            )
+
+        # Send discovery out of every enabled adapter so devices on secondary
+        # interfaces or VLANs are found without forcing their IP addresses
+        adapters = await network.async_get_adapters(self.hass)
+        self._controller.set_multicast_interfaces(
+            [
+                ip_info["address"]
+                for adapter in adapters
+                if adapter["enabled"]
+                for ip_info in adapter["ipv4"]
+            ]
+        )
         await self._controller.start()
 
     async def set_discovery_callback(
         self, callback: Callable[[GoveeLocalDevice, bool], bool]
     ) -> None:
         """Set discovery callback for automatic Govee light discovery."""
-        self._controller.set_device_discovered_callback(callback)
+        self._discovery_callback = callback
+
+    @callback
+    def _device_discovered(self, device: GoveeLocalDevice, is_new: bool) -> bool:
+        """Handle a device reported by the controller."""
+        if self._discovery_callback and not self._discovery_callback(device, is_new):
+            return False
+        if is_new:
+            # The controller stores the device only after this returns True
+            self._devices_snapshot = (*self._devices_snapshot, device)
+        self._first_device_event.set()
+        cached_ip = self._cached_ips.get(device.device_id)
+        if cached_ip != device.ip:
+            # The device has answered, so stop probing the address cached for it
+            if cached_ip is not None:
+                self._dequeue_cached_ip(cached_ip)
+            self._cached_ips[device.device_id] = device.ip
+            self._save_cached_ips()
+        elif is_new:
+            self._dequeue_cached_ip(cached_ip)
+        return True
+
+    @callback
+    def _device_evicted(self, device: GoveeLocalDevice) -> None:
+        """Handle a device removed by the controller."""
+        self._devices_snapshot = tuple(self._controller.devices)
+        if (cached_ip := self._cached_ips.pop(device.device_id, None)) is not None:
+            self._dequeue_cached_ip(cached_ip)
+            self._save_cached_ips()
+
+    @callback
+    def _prune_cached_ips(self, _now: Any) -> None:
+        """Forget cached devices that have not answered since startup."""
+        stale = [
+            device_id
+            for device_id in self._cached_ips
+            if self._controller.get_device_by_fingerprint(device_id) is None
+        ]
+        for device_id in stale:
+            _LOGGER.debug("Forgetting cached device %s", device_id)
+            self._dequeue_cached_ip(self._cached_ips.pop(device_id))
+        if stale:
+            self._save_cached_ips()
+
+    def _dequeue_cached_ip(self, ip: str) -> None:
+        """Stop probing a cached address unless it was forced."""
+        if ip not in self._forced_ips:
+            self._controller.remove_device_from_queue(ip)
+
+    def _save_cached_ips(self) -> None:
+        """Schedule saving the cached device addresses."""
+        self._store.async_delay_save(lambda: self._cached_ips, STORAGE_SAVE_DELAY)
+
+    async def async_wait_for_first_device(self) -> None:
+        """Wait until the first device has been discovered."""
+        await self._first_device_event.wait()
 
     def cleanup(self) -> asyncio.Event:
         """Stop and cleanup the coordinator."""
@@ -84,53 +189,73 @@ class GoveeLocalUdpCoordinator(DataUpdateCoordinator[List[GoveeLocalDevice]]):
 
     async def turn_on(self, device: GoveeLocalDevice) -> None:
         """Turn on the light."""
+        await self._async_reset_update_interval()
         await device.turn_on()
 
     async def turn_off(self, device: GoveeLocalDevice) -> None:
         """Turn off the light."""
+        await self._async_reset_update_interval()
         await device.turn_off()
 
     async def set_brightness(self, device: GoveeLocalDevice, brightness: int) -> None:
         """Set light brightness."""
+        await self._async_reset_update_interval()
         await device.set_brightness(brightness)
 
     async def set_rgb_color(
         self, device: GoveeLocalDevice, red: int, green: int, blue: int
     ) -> None:
         """Set light RGB color."""
+        await self._async_reset_update_interval()
         await device.set_rgb_color(red, green, blue)
 
     async def set_temperature(self, device: GoveeLocalDevice, temperature: int) -> None:
         """Set light color in kelvin."""
+        await self._async_reset_update_interval()
         await device.set_temperature(temperature)
 
-
     @property
-    def devices(self) -> List[GoveeLocalDevice]:
-        """Return a list of discovered Govee devices."""
-        return self._controller.devices
+    def devices(self) -> Tuple[GoveeLocalDevice, ...]:
+        """Return the discovered Govee devices."""
+        return self._devices_snapshot
 
-    async def _async_update_data(self) -> List[GoveeLocalDevice]:
+    async def _async_update_data(self) -> Tuple[GoveeLocalDevice, ...]:
         """Update device data."""
-        self._controller.send_update_message()
-        return self._controller.devices
-        
-    @callback
-    def register_device_callback(self, device_id: str, callback_fn):
-        """Register a callback for configuration changes affecting a device."""
-        self._device_callbacks[device_id] = callback_fn
+        await self._controller.async_send_update_message_paced()
+        self._adapt_update_interval()
+        return self._devices_snapshot
+
+    def _adapt_update_interval(self) -> None:
+        """Back off polling while device states are unchanged.
+
+        Replies to the previous poll have arrived by now, so the current states
+        are compared with the ones seen at the previous poll. Any change resets
+        the interval to SCAN_INTERVAL, otherwise it doubles up to MAX_SCAN_INTERVAL.
+        """
+        states = tuple(
+            (d.device_id, d.on, d.brightness, d.rgb_color, d.temperature_color)
+            for d in self._devices_snapshot
+        )
+        if states != self._last_states:
+            self._last_states = states
+            self.update_interval = SCAN_INTERVAL
+        else:
+            self.update_interval = min(self.update_interval * 2, MAX_SCAN_INTERVAL)
+
+    async def _async_reset_update_interval(self) -> None:
+        """Poll at the fastest rate again after a command is sent."""
+        if self.update_interval != SCAN_INTERVAL:
+            self.update_interval = SCAN_INTERVAL
+            # Make the next poll count as a change so it does not back off
+            # again before the command's effect is seen
+            self._last_states = ()
+            # Refreshing reschedules the next poll; listeners are only notified
+            # if the set of devices changed
+            await self.async_request_refresh()
         
-    @callback
-    def unregister_device_callback(self, device_id: str):
-        """Unregister a device callback."""
-        if device_id in self._device_callbacks:
-            del self._device_callbacks[device_id]
-    
-    @staticmethod
-    async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    async def async_options_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Handle options update."""
-        coordinator = hass.data[DOMAIN][entry.entry_id]
+        self.temperature_only_mode = entry.options.get(CONF_TEMP_ONLY_MODE, False)
         
         # Notify all lights of the options change
-        for device_id, callback_fn in coordinator._device_callbacks.items():
-            callback_fn(entry.options)
\ No newline at end of file
+        async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
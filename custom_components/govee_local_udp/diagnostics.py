@@ -11,10 +11,27 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import GoveeLocalUdpCoordinator
+from .protocol.controller import GoveeLocalDevice
+from .protocol.message import GoveeLightFeatures
 
 # Keys to redact from the diagnostics data
 TO_REDACT = {CONF_IP_ADDRESS, "ip"}
 
+# Capability flags reported for each device
+FEATURE_MASKS = (
+    ("has_brightness", GoveeLightFeatures.BRIGHTNESS),
+    ("has_color_rgb", GoveeLightFeatures.COLOR_RGB),
+    ("has_color_temperature", GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE),
+)
+
+
+def _capabilities_data(device: GoveeLocalDevice) -> Dict[str, Any]:
+    """Return the capability flags of a device."""
+    features = int(device.capabilities.features)
+    capabilities: Dict[str, Any] = {"features": features}
+    capabilities.update((name, bool(features & mask)) for name, mask in FEATURE_MASKS)
+    return capabilities
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -23,9 +40,8 @@ async def async_get_config_entry_diagnostics(
     coordinator: GoveeLocalUdpCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Convert device objects to dictionaries
-    devices_data = []
-    for device in coordinator.devices:
-        devices_data.append({
+    devices_data = [
+        {
             "device_id": device.device_id,
             "model": device.model,
             "ip": device.ip,
@@ -37,21 +53,17 @@ async def async_get_config_entry_diagnostics(
             "brightness": device.brightness,
             "rgb_color": device.rgb_color,
             "temperature_color": device.temperature_color,
-            "capabilities": {
-                "features": int(device.capabilities.features),
-                "has_brightness": bool(device.capabilities.features & 1),
-                "has_color_rgb": bool(device.capabilities.features & 2),
-                "has_color_temperature": bool(device.capabilities.features & 4),
-            },
-        })
-
-    diagnostics_data = {
+            "capabilities": _capabilities_data(device),
+        }
+        for device in coordinator.devices
+    ]
+
+    # Only the device data carries redacted keys
+    return {
         "config_entry": {
             "title": entry.title,
             "data": dict(entry.data),
             "options": dict(entry.options),
         },
-        "devices": devices_data,
+        "devices": async_redact_data(devices_data, TO_REDACT),
     }
-
-    return async_redact_data(diagnostics_data, TO_REDACT)
\ No newline at end of file
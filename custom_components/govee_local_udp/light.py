@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -14,18 +16,30 @@ from homeassistant.components.light import (
     filter_supported_color_modes,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_TEMP_ONLY_MODE, DOMAIN, MANUFACTURER
+from .const import DOMAIN, MANUFACTURER, SIGNAL_OPTIONS_UPDATED
 from .coordinator import GoveeLocalUdpCoordinator
 from .protocol.controller import GoveeLocalDevice
-from .protocol.message import GoveeLightFeatures
+from .protocol.message import MSG_BRIGHTNESS, MSG_COLOR, GoveeLightFeatures
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness conversion between Home Assistant (0-255) and the device (0-100)
+_BRIGHTNESS_100_TO_255 = tuple(round(i * 255 / 100) for i in range(101))
+_BRIGHTNESS_255_TO_100 = tuple(round(i * 100 / 255) for i in range(256))
+
+# Raw feature bits, tested against int(features) to avoid IntEnum operators
+_FEATURE_COLOR_RGB = GoveeLightFeatures.COLOR_RGB.value
+_FEATURE_COLOR_TEMPERATURE = GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE.value
+
+# Delay used to batch devices discovered close together into one add call
+NEW_DEVICE_ADD_DELAY = 0.25
 
 
 async def async_setup_entry(
@@ -37,27 +51,70 @@ async def async_setup_entry(
     coordinator: GoveeLocalUdpCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     # Add all current devices
-    async_add_entities(
-        GoveeLocalUdpLight(coordinator, device) for device in coordinator.devices
-    )
+    if coordinator.devices:
+        async_add_entities(
+            [GoveeLocalUdpLight(coordinator, device) for device in coordinator.devices]
+        )
+
+    pending_devices: list[GoveeLocalDevice] = []
+    cancel_add: CALLBACK_TYPE | None = None
+
+    @callback
+    def add_pending_devices(_now: datetime) -> None:
+        """Add all devices discovered since the last add."""
+        nonlocal cancel_add
+        cancel_add = None
+        async_add_entities(
+            [GoveeLocalUdpLight(coordinator, device) for device in pending_devices]
+        )
+        pending_devices.clear()
+
+    @callback
+    def cancel_pending_add() -> None:
+        """Cancel a scheduled add when the entry is unloaded."""
+        if cancel_add:
+            cancel_add()
+
+    config_entry.async_on_unload(cancel_pending_add)
 
     # Register callback for future device discovery
     @callback
     def device_discovery(device: GoveeLocalDevice, is_new: bool) -> bool:
         """Handle discovery of a new device."""
+        nonlocal cancel_add
         if is_new:
-            async_add_entities([GoveeLocalUdpLight(coordinator, device)])
+            pending_devices.append(device)
+            if cancel_add is None:
+                cancel_add = async_call_later(
+                    hass, NEW_DEVICE_ADD_DELAY, add_pending_devices
+                )
         return True
 
     await coordinator.set_discovery_callback(device_discovery)
 
 
+@lru_cache(maxsize=16)
+def _color_modes_for(features: int, temperature_only: bool) -> frozenset[ColorMode]:
+    """Return the supported color modes for a feature set, shared between lights."""
+    # For simplicity, all Govee lights support at least brightness
+    color_modes = {ColorMode.ONOFF, ColorMode.BRIGHTNESS}
+    
+    # Only add RGB mode if not in temperature-only mode
+    if features & _FEATURE_COLOR_RGB and not temperature_only:
+        color_modes.add(ColorMode.RGB)
+    
+    if features & _FEATURE_COLOR_TEMPERATURE:
+        color_modes.add(ColorMode.COLOR_TEMP)
+    
+    return frozenset(filter_supported_color_modes(color_modes))
+
+
 class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntity):
     """Representation of a Govee light."""
 
     _attr_has_entity_name = True
     _attr_name = None
-    _supported_color_modes: set[ColorMode]
+    _supported_color_modes: frozenset[ColorMode]
     _fixed_color_mode: ColorMode | None = None
 
     def __init__(
@@ -68,13 +125,12 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
         """Initialize a Govee light."""
         super().__init__(coordinator)
         self._device = device
+        self._last_written: tuple | None = None
+        self._write_scheduled = False
         device.add_update_callback(self._device_updated)
 
         # Entity attributes
         self._attr_unique_id = f"{DOMAIN}_{device.device_id}"
-        
-        # Register for coordinator options updates
-        coordinator.register_device_callback(device.device_id, self._handle_options_update)
 
         # Get device capabilities
         self._capabilities = device.capabilities
@@ -82,12 +138,12 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
         self._model = device.model
         
         # Check if temperature-only mode is enabled globally
-        self._temperature_only_mode = coordinator.config_entry.options.get(CONF_TEMP_ONLY_MODE, False)
+        self._temperature_only_mode = coordinator.temperature_only_mode
 
         # Set up device info
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device.device_id)},
-            name=f"Govee {device.model}",
+            name=device.display_name,
             manufacturer=MANUFACTURER,
             model=device.model,
         )
@@ -103,24 +159,24 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
         
     def _setup_color_modes(self) -> None:
         """Set up supported color modes based on capabilities and current options."""
-        # For simplicity, all Govee lights support at least brightness
-        color_modes = {ColorMode.ONOFF, ColorMode.BRIGHTNESS}
-            
-        # Only add RGB mode if not in temperature-only mode
-        if (GoveeLightFeatures.COLOR_RGB & self._capabilities.features) and not self._temperature_only_mode:
-            color_modes.add(ColorMode.RGB)
-            
-        if GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE & self._capabilities.features:
-            color_modes.add(ColorMode.COLOR_TEMP)
+        features = int(self._capabilities.features)
+        if features & _FEATURE_COLOR_TEMPERATURE:
             self._attr_min_color_temp_kelvin = self._capabilities.min_kelvin
             self._attr_max_color_temp_kelvin = self._capabilities.max_kelvin
         
-        # Filter and set the supported color modes
-        self._supported_color_modes = filter_supported_color_modes(color_modes)
+        self._supported_color_modes = _color_modes_for(
+            features, self._temperature_only_mode
+        )
         if len(self._supported_color_modes) == 1:
             self._fixed_color_mode = next(iter(self._supported_color_modes))
         else:
             self._fixed_color_mode = None
+        
+        # Flags checked by the state properties on every state write
+        self._has_rgb = ColorMode.RGB in self._supported_color_modes
+        self._has_temp = ColorMode.COLOR_TEMP in self._supported_color_modes
+        self._has_brightness = ColorMode.BRIGHTNESS in self._supported_color_modes
+        self._attr_color_mode = self._compute_color_mode()
 
     @property
     def is_on(self) -> bool:
@@ -130,45 +186,44 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
     @property
     def brightness(self) -> int:
         """Return the brightness of this light between 0..255."""
-        return int((self._device.brightness / 100.0) * 255.0)
+        return _BRIGHTNESS_100_TO_255[max(0, min(100, self._device.brightness))]
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the RGB color of the light."""
-        if ColorMode.RGB not in self.supported_color_modes:
+        if not self._has_rgb:
             return None
         return self._device.rgb_color
 
     @property
     def color_temp_kelvin(self) -> int | None:
         """Return the color temperature in Kelvin."""
-        if ColorMode.COLOR_TEMP not in self.supported_color_modes:
+        if not self._has_temp:
             return None
         return self._device.temperature_color
 
     @property
-    def supported_color_modes(self) -> set[ColorMode]:
+    def supported_color_modes(self) -> frozenset[ColorMode]:
         """Return the supported color modes."""
         return self._supported_color_modes
 
-    @property
-    def color_mode(self) -> ColorMode | str | None:
+    def _compute_color_mode(self) -> ColorMode:
         """Return the current color mode of the light."""
         if self._fixed_color_mode:
             return self._fixed_color_mode
 
         # Determine which mode the device is in
         if (
-            ColorMode.COLOR_TEMP in self.supported_color_modes
+            self._has_temp
             and self._device.temperature_color is not None
             and self._device.temperature_color > 0
         ):
             return ColorMode.COLOR_TEMP
 
-        if ColorMode.RGB in self.supported_color_modes:
+        if self._has_rgb:
             return ColorMode.RGB
 
-        if ColorMode.BRIGHTNESS in self.supported_color_modes:
+        if self._has_brightness:
             return ColorMode.BRIGHTNESS
 
         return ColorMode.ONOFF
@@ -176,18 +231,47 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
     @callback
     def _device_updated(self, device: GoveeLocalDevice) -> None:
         """Handle device updates."""
+        # Coalesce bursts of updates into a single state write per loop iteration
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.coordinator.hass.loop.call_soon(self._flush_state)
+
+    @callback
+    def _flush_state(self) -> None:
+        """Write the state if it changed since the last write."""
+        self._write_scheduled = False
+        device = self._device
+        snapshot = (
+            device.on,
+            device.brightness,
+            device.rgb_color,
+            device.temperature_color,
+        )
+        if snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        # The color mode only depends on the state captured in the snapshot
+        self._attr_color_mode = self._compute_color_mode()
+        if self.hass is None:
+            # Not added yet, the state is written when the entity is added
+            return
+        # Device callbacks run on the event loop, so write directly instead of
+        # going through schedule_update_ha_state and call_soon_threadsafe
         self.async_write_ha_state()
         
     @callback
-    def _handle_options_update(self, options) -> None:
+    def _handle_options_update(self) -> None:
         """Handle options updates."""
-        new_temp_only_mode = options.get(CONF_TEMP_ONLY_MODE, False)
+        new_temp_only_mode = self.coordinator.temperature_only_mode
         
         # Only update if the temperature-only mode setting has changed
         if new_temp_only_mode != self._temperature_only_mode:
             self._temperature_only_mode = new_temp_only_mode
             self._setup_color_modes()
-            _LOGGER.debug(f"Updated temperature-only mode to {new_temp_only_mode} for {self.entity_id}")
+            _LOGGER.debug(
+                "Updated temperature-only mode to %s for %s", new_temp_only_mode, self.entity_id
+            )
             self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -198,13 +282,28 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
 
         # Apply brightness if provided
         if ATTR_BRIGHTNESS in kwargs:
-            brightness = int((kwargs[ATTR_BRIGHTNESS] / 255.0) * 100.0)
-            await self.coordinator.set_brightness(self._device, brightness)
+            brightness = _BRIGHTNESS_255_TO_100[kwargs[ATTR_BRIGHTNESS]]
+            # The device state lags behind a pending command, so only skip
+            # when nothing else is on its way
+            if (
+                brightness == self._device.brightness
+                and not self._device.has_pending_command(MSG_BRIGHTNESS)
+            ):
+                _LOGGER.debug("Brightness of %s already %s, not sending", self.entity_id, brightness)
+            else:
+                await self.coordinator.set_brightness(self._device, brightness)
 
         # Apply colors/temperature
         if ATTR_RGB_COLOR in kwargs:
             red, green, blue = kwargs[ATTR_RGB_COLOR]
-            await self.coordinator.set_rgb_color(self._device, red, green, blue)
+            if (
+                self._attr_color_mode == ColorMode.RGB
+                and self._device.rgb_color == (red, green, blue)
+                and not self._device.has_pending_command(MSG_COLOR)
+            ):
+                _LOGGER.debug("Color of %s already %s, not sending", self.entity_id, kwargs[ATTR_RGB_COLOR])
+            else:
+                await self.coordinator.set_rgb_color(self._device, red, green, blue)
         elif ATTR_COLOR_TEMP_KELVIN in kwargs:
             temperature = int(kwargs[ATTR_COLOR_TEMP_KELVIN])
             await self.coordinator.set_temperature(self._device, temperature)
@@ -214,9 +313,13 @@ class GoveeLocalUdpLight(CoordinatorEntity[GoveeLocalUdpCoordinator], LightEntit
         """Turn off the light."""
         await self.coordinator.turn_off(self._device)
         
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up resources when entity is removed."""
-        # Remove the options update callback
-        self.coordinator.unregister_device_callback(self._device.device_id)
-        await super().async_will_remove_from_hass()
-
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to options updates when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self.coordinator.config_entry.entry_id),
+                self._handle_options_update,
+            )
+        )
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from .message import GoveeLightFeatures
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GoveeLightCapabilities:
     """Capabilities of a Govee light."""
 
@@ -24,6 +25,14 @@ ON_OFF_CAPABILITIES = GoveeLightCapabilities(
     features=GoveeLightFeatures.NONE,
 )
 
+# RGB light capability profile with brightness and color, but no temperature
+RGB_LIGHT_CAPABILITIES = GoveeLightCapabilities(
+    features=(
+        GoveeLightFeatures.BRIGHTNESS 
+        | GoveeLightFeatures.COLOR_RGB
+    ),
+)
+
 # Standard RGB light capability profile with brightness, color, and temperature
 STANDARD_LIGHT_CAPABILITIES = GoveeLightCapabilities(
     features=(
@@ -36,58 +45,25 @@ STANDARD_LIGHT_CAPABILITIES = GoveeLightCapabilities(
 # This is a simplified version of the capabilities database
 # In a real implementation, we would have a more complete database of models and their capabilities
 # This would be populated from external sources or through discovery
-GOVEE_LIGHT_CAPABILITIES: Dict[str, GoveeLightCapabilities] = {
+# Models with the same capabilities share a single instance
+GOVEE_LIGHT_CAPABILITIES: Mapping[str, GoveeLightCapabilities] = MappingProxyType({
     # H6160: RGB LED Strip
-    "H6160": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB
-        ),
-    ),
+    "H6160": RGB_LIGHT_CAPABILITIES,
     
     # H6163: RGB LED Strip with temperature
-    "H6163": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB 
-            | GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE
-        ),
-    ),
+    "H6163": STANDARD_LIGHT_CAPABILITIES,
     
     # H6104: RGB Bulb
-    "H6104": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB 
-            | GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE
-        ),
-    ),
+    "H6104": STANDARD_LIGHT_CAPABILITIES,
     
     # H6199: RGB LED Strip
-    "H6199": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB
-        ),
-    ),
+    "H6199": RGB_LIGHT_CAPABILITIES,
     
     # H7022: Bedside Lamp
-    "H7022": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB 
-            | GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE
-        ),
-    ),
+    "H7022": STANDARD_LIGHT_CAPABILITIES,
     
     # H6198: RGB Floor Lamp
-    "H6198": GoveeLightCapabilities(
-        features=(
-            GoveeLightFeatures.BRIGHTNESS 
-            | GoveeLightFeatures.COLOR_RGB 
-            | GoveeLightFeatures.COLOR_KELVIN_TEMPERATURE
-        ),
-    ),
+    "H6198": STANDARD_LIGHT_CAPABILITIES,
     
     # H60A1: RGB Light with limited kelvin range
     "H60A1": GoveeLightCapabilities(
@@ -102,17 +78,17 @@ GOVEE_LIGHT_CAPABILITIES: Dict[str, GoveeLightCapabilities] = {
     
     # Default capabilities for unknown devices - only enable basic features
     "unknown": STANDARD_LIGHT_CAPABILITIES,
-}
+})
 
 
 def get_capabilities_for_model(model: str) -> GoveeLightCapabilities:
     """Get the capabilities for a given model number."""
-    if model in GOVEE_LIGHT_CAPABILITIES:
-        return GOVEE_LIGHT_CAPABILITIES[model]
+    if (capabilities := GOVEE_LIGHT_CAPABILITIES.get(model)) is not None:
+        return capabilities
     
     _LOGGER.warning(
         "Unknown Govee model: %s. Using default capabilities. "
         "Please report this to improve device support.",
         model
     )
-    return GOVEE_LIGHT_CAPABILITIES["unknown"]
\ No newline at end of file
+    return GOVEE_LIGHT_CAPABILITIES["unknown"]
@@ -6,9 +6,13 @@ import asyncio
 import ipaddress
 import logging
 import socket
+import sys
+from collections import OrderedDict
 from collections.abc import Callable
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from contextlib import suppress
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple, Union
 
 from .capabilities import GoveeLightCapabilities, get_capabilities_for_model
 from .message import (
@@ -35,13 +39,36 @@ COMMAND_PORT = 4003
 DISCOVERY_INTERVAL = 60  # Search for new devices every 60 seconds
 EVICT_INTERVAL = DISCOVERY_INTERVAL * 3  # Remove devices after 3x discovery interval
 UPDATE_INTERVAL = 5  # Update device status every 5 seconds
+COMMAND_DEBOUNCE = 0.05  # Coalesce commands of the same type sent within 50ms
 RETRY_PATTERN = [0.2, 0.5, 1.0, 2.0, 3.0, 4.0, 5.0, 7.0, 10.0]  # Retry backoff pattern
 
+# Number of status requests sent before yielding to the event loop
+UPDATE_BATCH_SIZE = 32
+
+# Maximum number of received datagrams waiting to be processed
+RX_QUEUE_SIZE = 1024
+
+# Kernel receive buffer requested for the listening socket, so replies from
+# many devices answering the same scan are not dropped
+RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Maximum number of state verification events kept for reuse
+EVENT_POOL_SIZE = 32
+
+# Scan and status requests carry no parameters, so the packets are encoded once
+SCAN_REQUEST_PAYLOAD = ScanMessage().to_bytes()
+STATUS_REQUEST_PAYLOAD = DevStatusMessage().to_bytes()
+
 # Connection retry settings
 CONNECTION_RETRY_ATTEMPTS = 5
 CONNECTION_RETRY_DELAY = 2  # seconds
 
 
+def _accept_device(device: GoveeLocalDevice, is_new: bool) -> bool:
+    """Accept every device when no discovered callback is set."""
+    return True
+
+
 class GoveeLocalDevice:
     """Representation of a Govee device on the local network."""
 
@@ -61,11 +88,16 @@ class GoveeLocalDevice:
         """Initialize the device."""
         self._controller = controller
         self._ip = ip
+        # Destination for commands and status requests, built once per address
+        self._command_address = (ip, controller._device_command_port)
         self._device_id = device_id
-        self._model = model
-        self._capabilities = capabilities or get_capabilities_for_model(model)
+        # Interned so capability lookups and model comparisons hit identity checks
+        self._model = sys.intern(model)
+        self._capabilities = capabilities or get_capabilities_for_model(self._model)
         self._is_manual = is_manual
-        self._update_callbacks: List[Callable[[GoveeLocalDevice], None]] = []
+        # Keyed by the callback itself, used as an insertion ordered set. Bound
+        # methods compare equal across accesses, unlike their id()
+        self._update_callbacks: Dict[Callable[[GoveeLocalDevice], None], None] = {}
         
         # Version information
         self._ble_hardware_version = ble_hardware_version
@@ -78,7 +110,9 @@ class GoveeLocalDevice:
         self._brightness: int = 100
         self._rgb_color: Optional[Tuple[int, int, int]] = (255, 255, 255)
         self._color_temp: Optional[int] = None
-        self._lastseen = datetime.now()
+        # Monotonic loop time, converted to a datetime only when read
+        self._time = controller._loop_time
+        self._lastseen = self._time()
         
         # Command tracking for cooldown periods
         self._last_command_time: Dict[str, datetime] = {}
@@ -98,6 +132,11 @@ class GoveeLocalDevice:
         """Return the device model."""
         return self._model
     
+    @cached_property
+    def display_name(self) -> str:
+        """Return a human readable name for the device."""
+        return f"Govee {self._model}"
+    
     @property
     def fingerprint(self) -> str:
         """Return a unique identifier for this device."""
@@ -136,7 +175,7 @@ class GoveeLocalDevice:
     @property
     def lastseen(self) -> datetime:
         """Return when the device was last seen."""
-        return self._lastseen
+        return datetime.now() - timedelta(seconds=self._time() - self._lastseen)
         
     @property
     def ble_hardware_version(self) -> str:
@@ -158,21 +197,43 @@ class GoveeLocalDevice:
         """Return the WiFi software version."""
         return self._wifi_software_version
     
+    def has_pending_command(self, command: str) -> bool:
+        """Return whether a command of this type is queued or being retried."""
+        if not self._controller:
+            return False
+        return self._controller.has_pending_command(self, command)
+    
+    def _set_ip(self, ip: str) -> None:
+        """Update the device IP address and its command destination."""
+        self._ip = ip
+        self._command_address = (ip, self._command_address[1])
+    
     def update_lastseen(self) -> None:
         """Update the last seen timestamp."""
-        self._lastseen = datetime.now()
+        self._lastseen = self._time()
     
     def add_update_callback(self, callback: Callable[[GoveeLocalDevice], None]) -> None:
         """Add a callback to call when the device state changes."""
-        self._update_callbacks.append(callback)
+        self._update_callbacks[callback] = None
     
     def remove_update_callback(self, callback: Callable[[GoveeLocalDevice], None]) -> None:
         """Remove an update callback."""
-        if callback in self._update_callbacks:
-            self._update_callbacks.remove(callback)
+        self._update_callbacks.pop(callback, None)
     
     def update(self, status: DeviceStatus) -> None:
         """Update the device state from a status message."""
+        rgb_color = (status.color.r, status.color.g, status.color.b)
+        
+        # Most status replies repeat the current state, skip the callbacks then
+        if (
+            status.on == self._on
+            and status.brightness == self._brightness
+            and rgb_color == self._rgb_color
+            and (status.color_temperature_kelvin or self._color_temp) == self._color_temp
+        ):
+            self.update_lastseen()
+            return
+        
         # Check for cooldown periods for specific properties
         now = datetime.now()
         
@@ -186,7 +247,7 @@ class GoveeLocalDevice:
         
         # Update RGB color if not in cooldown
         if "color" not in self._last_command_time or (now - self._last_command_time["color"]).total_seconds() > 0.5:
-            self._rgb_color = (status.color.r, status.color.g, status.color.b)
+            self._rgb_color = rgb_color
         
         # Update color temperature if not in cooldown and value is valid
         if status.color_temperature_kelvin > 0:
@@ -195,7 +256,7 @@ class GoveeLocalDevice:
         
         self.update_lastseen()
         
-        # Notify callbacks
+        # Notify callbacks, always from the event loop thread
         for callback in self._update_callbacks:
             callback(self)
     
@@ -267,20 +328,39 @@ class GoveeController:
         # Network settings
         self._transport: Any = None
         self._protocol = None
+        self._multicast_interfaces: List[str] = []
+        self._multicast_transports: List[Any] = []
         self._broadcast_address = broadcast_address
         self._broadcast_port = broadcast_port
+        self._broadcast_destination = (broadcast_address, broadcast_port)
         self._listening_address = listening_address
         self._listening_port = listening_port
         self._device_command_port = device_command_port
+        # Addresses are fixed for the controller's lifetime, so the socket
+        # option values are computed once
+        self._is_multicast = ipaddress.ip_address(broadcast_address).is_multicast
+        self._listening_packed = socket.inet_aton(listening_address)
+        self._mreq = socket.inet_aton(broadcast_address) + self._listening_packed
         
         # Asyncio and message handling
         self._loop = loop or asyncio.get_running_loop()
+        # Loop methods used on every command, timer and status reply
+        self._create_task = self._loop.create_task
+        self._call_at = self._loop.call_at
+        self._loop_time = self._loop.time
         self._cleanup_done: asyncio.Event = asyncio.Event()
         self._message_factory = MessageResponseFactory()
+        self._rx_queue: asyncio.Queue[Tuple[bytes, Tuple]] = asyncio.Queue(maxsize=RX_QUEUE_SIZE)
+        self._rx_task: Optional[asyncio.Task] = None
         
         # Device tracking
-        self._devices: Dict[str, GoveeLocalDevice] = {}
-        self._device_queue: Set[str] = set()
+        # Ordered from least to most recently seen, so eviction only has to
+        # look at the front
+        self._devices: OrderedDict[str, GoveeLocalDevice] = OrderedDict()
+        # Secondary index for status replies, which only carry the sender address
+        self._devices_by_ip: Dict[str, GoveeLocalDevice] = {}
+        # Queued IP addresses mapped to their prebuilt scan destination
+        self._device_queue: Dict[str, Tuple[str, int]] = {}
         
         # Timers and intervals
         self._discovery_enabled = discovery_enabled
@@ -289,24 +369,60 @@ class GoveeController:
         self._update_interval = update_interval
         self._evict_enabled = evict_enabled
         self._evict_interval = evict_interval
+        self._last_evict_time = 0.0
         
         # Callbacks
         self._device_discovered_callback = discovered_callback
+        # Called for every scan reply, resolved once instead of checked per call
+        self._call_discovered_callback: Callable[[GoveeLocalDevice, bool], bool] = (
+            discovered_callback or _accept_device
+        )
         self._device_evicted_callback = evicted_callback
         
         # Timer handles
         self._discovery_handle: Optional[asyncio.TimerHandle] = None
         self._update_handle: Optional[asyncio.TimerHandle] = None
+        # Loop times the periodic sends are scheduled for, so the cadence is
+        # measured from deadline to deadline and does not drift
+        self._discovery_deadline = 0.0
+        self._update_deadline = 0.0
         
         # Command retry tracking
-        self._pending_command_tasks: Dict[str, asyncio.Task] = {}
+        # Pending command tasks by device fingerprint, then by command
+        self._pending_command_tasks: Dict[str, Dict[str, asyncio.Task]] = {}
+        # Latest not yet sent command values by device fingerprint, then by command
+        self._queued_commands: Dict[str, Dict[str, Tuple[GoveeMessage, Optional[Callable]]]] = {}
         self._state_verification_events: Dict[str, Tuple[asyncio.Event, Callable]] = {}
+        self._event_pool: List[asyncio.Event] = []
+        
+        # Response handlers by message type, looked up once per datagram
+        self._message_handlers: Dict[type, Callable[[Any, Tuple], None]] = {
+            GoveeDevice: self._handle_scan_response,
+            DeviceStatus: self._handle_status_update_response,
+        }
     
     async def start(self) -> None:
         """Start the controller."""
         self._transport, self._protocol = await self._loop.create_datagram_endpoint(
             lambda: self, local_addr=(self._listening_address, self._listening_port)
         )
+        self._rx_task = self._create_task(self._process_datagrams())
+        
+        if self._multicast_interfaces:
+            results = await asyncio.gather(
+                *(
+                    self._create_multicast_transport(interface)
+                    for interface in self._multicast_interfaces
+                ),
+                return_exceptions=True,
+            )
+            for interface, result in zip(self._multicast_interfaces, results):
+                if isinstance(result, Exception):
+                    self._logger.warning(
+                        "Unable to send discovery on interface %s: %s", interface, result
+                    )
+                else:
+                    self._multicast_transports.append(result)
         
         if self._discovery_enabled:
             self.send_discovery_message()
@@ -322,36 +438,60 @@ class GoveeController:
         if self._transport:
             self._transport.close()
         
+        if self._rx_task:
+            self._rx_task.cancel()
+            self._rx_task = None
+        
+        for transport in self._multicast_transports:
+            transport.close()
+        self._multicast_transports.clear()
+        
         # Cancel all pending commands
-        for task in self._pending_command_tasks.values():
-            if not task.done():
-                task.cancel()
+        for tasks in self._pending_command_tasks.values():
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+        self._queued_commands.clear()
         
         self._devices.clear()
+        self._devices_by_ip.clear()
         self._device_queue.clear()
         return self._cleanup_done
     
+    async def _create_multicast_transport(self, interface: str) -> Any:
+        """Create a send-only transport bound to a single interface."""
+        transport, _ = await self._loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, local_addr=(interface, 0)
+        )
+        sock = transport.get_extra_info("socket")
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+        sock.setsockopt(
+            socket.SOL_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+        )
+        return transport
+    
+    def set_multicast_interfaces(self, interfaces: List[str]) -> None:
+        """Set the interface addresses used to send discovery messages."""
+        self._multicast_interfaces = list(interfaces)
+    
     def add_device_to_queue(self, ip: str) -> bool:
         """Add a device to the discovery queue."""
         if ip in self._device_queue:
             return False
         
-        self._device_queue.add(ip)
+        self._device_queue[ip] = (ip, self._broadcast_port)
         if not self._discovery_enabled:
             self.send_discovery_message()
         return True
     
     def remove_device_from_queue(self, ip: str) -> bool:
         """Remove a device from the discovery queue."""
-        if ip in self._device_queue:
-            self._device_queue.remove(ip)
-            return True
-        return False
+        return self._device_queue.pop(ip, None) is not None
     
     @property
-    def device_queue(self) -> Set[str]:
+    def device_queue(self) -> AbstractSet[str]:
         """Return the set of devices in the discovery queue."""
-        return self._device_queue
+        return self._device_queue.keys()
     
     def remove_device(self, device: str | GoveeLocalDevice) -> None:
         """Remove a device."""
@@ -360,20 +500,17 @@ class GoveeController:
         
         if device in self._devices:
             # Clear any pending tasks for this device
-            keys_to_remove = [
-                key for key in self._pending_command_tasks if key.startswith(f"{device}_")
-            ]
-            for key in keys_to_remove:
-                task = self._pending_command_tasks.pop(key)
+            for task in self._pending_command_tasks.pop(device, {}).values():
                 if not task.done():
                     task.cancel()
+            self._queued_commands.pop(device, None)
             
             # Remove verification events
             if device in self._state_verification_events:
                 del self._state_verification_events[device]
             
             # Remove the device itself
-            del self._devices[device]
+            self._remove_from_index(self._devices.pop(device))
     
     @property
     def evict_enabled(self) -> bool:
@@ -395,6 +532,7 @@ class GoveeController:
         elif self._discovery_handle:
             self._discovery_handle.cancel()
             self._discovery_handle = None
+            self._discovery_deadline = 0.0
     
     @property
     def discovery_enabled(self) -> bool:
@@ -416,6 +554,7 @@ class GoveeController:
         """Set the callback for device discovery."""
         old_callback = self._device_discovered_callback
         self._device_discovered_callback = callback
+        self._call_discovered_callback = callback or _accept_device
         return old_callback
     
     def set_update_enabled(self, enabled: bool) -> None:
@@ -429,6 +568,7 @@ class GoveeController:
         elif self._update_handle:
             self._update_handle.cancel()
             self._update_handle = None
+            self._update_deadline = 0.0
     
     @property
     def update_enabled(self) -> bool:
@@ -440,35 +580,32 @@ class GoveeController:
         if not self._transport:
             return
         
-        # Create message
-        message = ScanMessage()
+        payload = SCAN_REQUEST_PAYLOAD
         
-        # Send to multicast group
+        # Send to multicast group, once per interface when more than one is known
         if self._discovery_enabled:
-            self._transport.sendto(
-                message.to_bytes(),
-                (self._broadcast_address, self._broadcast_port)
-            )
+            for transport in self._multicast_transports or [self._transport]:
+                transport.sendto(payload, self._broadcast_destination)
         
         # Send to queued devices
-        for ip in self._device_queue:
-            self._transport.sendto(
-                message.to_bytes(),
-                (ip, self._broadcast_port)
-            )
+        for destination in self._device_queue.values():
+            self._transport.sendto(payload, destination)
         
         # Send to manually added devices
-        manually_added_devices = [device.ip for device in self._devices.values() if device.is_manual]
-        for ip in manually_added_devices:
-            self._transport.sendto(
-                message.to_bytes(),
-                (ip, self._broadcast_port)
-            )
+        for device in self._devices.values():
+            if device.is_manual:
+                self._transport.sendto(
+                    payload,
+                    (device.ip, self._broadcast_port)
+                )
         
         # Schedule next discovery if enabled
         if self._discovery_enabled:
-            self._discovery_handle = self._loop.call_later(
-                self._discovery_interval, self.send_discovery_message
+            self._discovery_deadline = self._next_deadline(
+                self._discovery_deadline, self._discovery_interval
+            )
+            self._discovery_handle = self._call_at(
+                self._discovery_deadline, self.send_discovery_message
             )
     
     def send_update_message(self, device: Optional[GoveeLocalDevice] = None) -> None:
@@ -484,10 +621,41 @@ class GoveeController:
         
         # Schedule next update if enabled
         if self._update_enabled and not device:  # Only reschedule if not for a specific device
-            self._update_handle = self._loop.call_later(
-                self._update_interval, self.send_update_message
+            self._update_deadline = self._next_deadline(
+                self._update_deadline, self._update_interval
+            )
+            self._update_handle = self._call_at(
+                self._update_deadline, self.send_update_message
             )
     
+    def _next_deadline(self, deadline: float, interval: float) -> float:
+        """Return the deadline one interval after the previous one.
+        
+        Starts over from now on the first run, or when the loop fell behind by
+        more than an interval.
+        """
+        next_deadline = deadline + interval
+        now = self._loop_time()
+        if next_deadline <= now:
+            return now + interval
+        return next_deadline
+    
+    async def async_send_update_message_paced(
+        self, batch_size: int = UPDATE_BATCH_SIZE
+    ) -> None:
+        """Send an update message to every device, yielding between batches.
+
+        Sends to unreachable hosts can stall while ARP resolution is pending,
+        so the sweep yields to the event loop every batch_size devices.
+        """
+        if not self._transport:
+            return
+        
+        for i, device in enumerate(list(self._devices.values()), 1):
+            self._send_update_message(device)
+            if i % batch_size == 0:
+                await asyncio.sleep(0)
+    
     async def _execute_command(
         self,
         device: GoveeLocalDevice,
@@ -495,33 +663,64 @@ class GoveeController:
         verify_state_callback=None
     ) -> None:
         """Execute a command with retry queue and optional state verification."""
-        device_key = f"{device.fingerprint}_{message.command}"
+        command = message.command
+        queued = self._queued_commands.setdefault(device.fingerprint, {})
+        device_tasks = self._pending_command_tasks.setdefault(device.fingerprint, {})
         
-        # Cancel any existing task for this device and command
-        if device_key in self._pending_command_tasks:
-            existing_task = self._pending_command_tasks[device_key]
-            if not existing_task.done():
-                existing_task.cancel()
-                try:
-                    await existing_task
-                except asyncio.CancelledError:
-                    self._logger.debug(f"Cancelled pending {message.command} task for device {device}")
-                
-                # Add a small delay to allow any in-flight commands to complete
-                # This helps prevent command overlap on the device
-                await asyncio.sleep(0.3)
+        # Only the latest value is kept; a task still waiting out the debounce
+        # delay has not sent anything yet and picks it up
+        debouncing = command in queued
+        queued[command] = (message, verify_state_callback)
+        task = device_tasks.get(command)
         
-        # Create and store the new task
-        task = self._loop.create_task(
-            self._execute_with_retries(device, message, verify_state_callback)
-        )
-        self._pending_command_tasks[device_key] = task
+        # Cancel an existing task that already sent an older value
+        if task and not task.done() and not debouncing:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                self._logger.debug("Cancelled pending %s task for device %s", message.command, device)
+            
+            # Add a small delay to allow any in-flight commands to complete
+            # This helps prevent command overlap on the device
+            await asyncio.sleep(0.3)
+            task = device_tasks.get(command)
         
-        task.add_done_callback(
-            lambda t: self._pending_command_tasks.pop(device_key, None)
-        )
+        if task is None or task.done():
+            if command not in queued:
+                # A newer command already picked up and sent the latest value
+                return
+            
+            # Create and store the new task
+            task = self._create_task(self._execute_queued_command(device, command))
+            device_tasks[command] = task
+            task._command_key = (device.fingerprint, command)
+            task.add_done_callback(self._on_command_done)
         
-        await task
+        # Several callers can wait on the same task, so one of them being
+        # cancelled must not cancel the command for the others
+        await asyncio.shield(task)
+    
+    def has_pending_command(self, device: GoveeLocalDevice, command: str) -> bool:
+        """Return whether a command is queued or being retried for a device."""
+        if command in self._queued_commands.get(device.fingerprint, ()):
+            return True
+        task = self._pending_command_tasks.get(device.fingerprint, {}).get(command)
+        return task is not None and not task.done()
+    
+    def _on_command_done(self, task: asyncio.Task) -> None:
+        """Forget a finished command task unless a newer one replaced it."""
+        fingerprint, command = task._command_key
+        device_tasks = self._pending_command_tasks.get(fingerprint)
+        if device_tasks and device_tasks.get(command) is task:
+            del device_tasks[command]
+    
+    async def _execute_queued_command(self, device: GoveeLocalDevice, command: str) -> None:
+        """Send the latest queued value of a command once the debounce delay passed."""
+        queued = self._queued_commands[device.fingerprint]
+        await asyncio.sleep(COMMAND_DEBOUNCE)
+        message, verify_state_callback = queued.pop(command)
+        await self._execute_with_retries(device, message, verify_state_callback)
     
     async def _execute_with_retries(
         self,
@@ -545,8 +744,8 @@ class GoveeController:
         if not verify_state_callback:
             return await self._execute_basic_retries(device, message, max_retries)
         
-        # Create a state verification event
-        state_changed_event = asyncio.Event()
+        # Reuse a state verification event from the pool when one is available
+        state_changed_event = self._event_pool.pop() if self._event_pool else asyncio.Event()
         device_key = device.fingerprint
         
         # Register our event and verification callback
@@ -557,57 +756,37 @@ class GoveeController:
             for i, delay in enumerate(RETRY_PATTERN[:max_retries-1]):
                 try:
                     # Wait for either the delay to complete or the state to change
-                    state_changed_task = asyncio.create_task(state_changed_event.wait())
-                    delay_task = asyncio.create_task(asyncio.sleep(delay))
+                    with suppress(TimeoutError):
+                        async with asyncio.timeout(delay):
+                            await state_changed_event.wait()
                     
-                    # Wait for either task to complete
-                    try:
-                        done, pending = await asyncio.wait(
-                            [state_changed_task, delay_task],
-                            return_when=asyncio.FIRST_COMPLETED
+                    # If state changed, we're done
+                    if state_changed_event.is_set():
+                        self._logger.debug(
+                            "Stopping retries for %s: %s - desired state reached",
+                            device,
+                            message.command,
                         )
-                        
-                        # Cancel the pending task
-                        for task in pending:
-                            task.cancel()
-                            try:
-                                # Wait for the cancelled task to complete
-                                await task
-                            except asyncio.CancelledError:
-                                # This is expected for cancelled tasks
-                                pass
-                        
-                        # If state changed, we're done
-                        if state_changed_task in done and not state_changed_task.cancelled():
-                            if state_changed_task.result():
-                                self._logger.debug(
-                                    f"Stopping retries for {device}: {message.command} - desired state reached"
-                                )
-                                return
-                    except asyncio.CancelledError:
-                        state_changed_task.cancel()
-                        delay_task.cancel()
-                        try:
-                            await asyncio.gather(state_changed_task, delay_task, return_exceptions=True)
-                        except asyncio.CancelledError:
-                            pass
-                        raise
-                    
-                    # Check if we've been cancelled
-                    if asyncio.current_task().cancelled():
                         return
                     
                     # Send the command again
                     self._send_message(message, device)
                     await asyncio.sleep(0.5)
                     self._send_update_message(device)
-                    self._logger.debug(f"Retry {i+1} for {device}: {message.command}")
+                    self._logger.debug("Retry %d for %s: %s", i + 1, device, message.command)
                 except asyncio.CancelledError:
-                    self._logger.debug(f"Cancelled during retry {i+1} for {device}")
+                    self._logger.debug("Cancelled during retry %d for %s", i + 1, device)
                     raise
         finally:
-            # Clean up our event registration
-            self._state_verification_events.pop(device_key, None)
+            # Clean up our event registration, unless the status handler already
+            # released it or a newer command replaced it, and return the event
+            # to the pool
+            registration = self._state_verification_events.get(device_key)
+            if registration and registration[0] is state_changed_event:
+                del self._state_verification_events[device_key]
+            if len(self._event_pool) < EVENT_POOL_SIZE:
+                state_changed_event.clear()
+                self._event_pool.append(state_changed_event)
     
     async def _execute_basic_retries(
         self,
@@ -632,9 +811,9 @@ class GoveeController:
                 
                 # Request a status update after sending the command
                 self._send_update_message(device)
-                self._logger.debug(f"Retry {i+1} for {device}: {message.command}")
+                self._logger.debug("Retry %d for %s: %s", i + 1, device, message.command)
             except asyncio.CancelledError:
-                self._logger.debug(f"Cancelled during retry {i+1} for {device}")
+                self._logger.debug("Cancelled during retry %d for %s", i + 1, device)
                 raise
     
     async def turn_on_off(self, device: GoveeLocalDevice, status: bool) -> None:
@@ -671,7 +850,12 @@ class GoveeController:
         def verify_state(device):
             if rgb and device.rgb_color:
                 # Allow for small differences in RGB values
-                return all(abs(a - b) <= 5 for a, b in zip(device.rgb_color, rgb))
+                current = device.rgb_color
+                return (
+                    abs(current[0] - rgb[0]) <= 5
+                    and abs(current[1] - rgb[1]) <= 5
+                    and abs(current[2] - rgb[2]) <= 5
+                )
             elif temperature and device.temperature_color:
                 # Allow for small differences in temperature
                 return abs(device.temperature_color - temperature) <= 100
@@ -683,10 +867,7 @@ class GoveeController:
     
     def get_device_by_ip(self, ip: str) -> Optional[GoveeLocalDevice]:
         """Get a device by IP address."""
-        for device in self._devices.values():
-            if device.ip == ip:
-                return device
-        return None
+        return self._devices_by_ip.get(ip)
     
     def get_device_by_model(self, model: str) -> List[GoveeLocalDevice]:
         """Get devices by model."""
@@ -720,35 +901,27 @@ class GoveeController:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         
-        broadcast_ip = ipaddress.ip_address(self._broadcast_address)
+        # The kernel caps the size at net.core.rmem_max, so log what was granted
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+        except OSError as ex:
+            self._logger.debug("Unable to set receive buffer size: %s", ex)
+        self._logger.debug(
+            "Receive buffer size: %d", sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        )
         
-        if broadcast_ip.is_multicast:
+        if self._is_multicast:
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
-            
             sock.setsockopt(
-                socket.SOL_IP,
-                socket.IP_MULTICAST_IF,
-                socket.inet_aton(self._listening_address),
-            )
-            sock.setsockopt(
-                socket.SOL_IP,
-                socket.IP_ADD_MEMBERSHIP,
-                socket.inet_aton(self._broadcast_address)
-                + socket.inet_aton(self._listening_address),
+                socket.SOL_IP, socket.IP_MULTICAST_IF, self._listening_packed
             )
+            sock.setsockopt(socket.SOL_IP, socket.IP_ADD_MEMBERSHIP, self._mreq)
     
     def connection_lost(self, exc) -> None:
         """Handle connection lost."""
-        if self._transport:
-            broadcast_ip = ipaddress.ip_address(self._broadcast_address)
-            if broadcast_ip.is_multicast:
-                sock = self._transport.get_extra_info("socket")
-                sock.setsockopt(
-                    socket.SOL_IP,
-                    socket.IP_DROP_MEMBERSHIP,
-                    socket.inet_aton(self._broadcast_address)
-                    + socket.inet_aton(self._listening_address),
-                )
+        if self._transport and self._is_multicast:
+            sock = self._transport.get_extra_info("socket")
+            sock.setsockopt(socket.SOL_IP, socket.IP_DROP_MEMBERSHIP, self._mreq)
         
         self._cleanup_done.set()
         self._logger.debug("Disconnected")
@@ -756,51 +929,83 @@ class GoveeController:
     def datagram_received(self, data: bytes, addr: Tuple) -> None:
         """Handle received datagram."""
         if data:
-            self._logger.debug(f"Received {len(data)} bytes from {addr}")
-            self._loop.create_task(self._handle_datagram_received(data, addr))
+            # Only queue here so the socket is drained quickly during bursts
+            try:
+                self._rx_queue.put_nowait((data, addr))
+            except asyncio.QueueFull:
+                self._logger.warning("Receive queue full, dropping datagram from %s", addr)
+    
+    async def _process_datagrams(self) -> None:
+        """Process queued datagrams in order."""
+        queue = self._rx_queue
+        while True:
+            data, addr = await queue.get()
+            self._handle_datagram_received(data, addr)
+            # Handling never awaits, so drain the rest of a burst without
+            # suspending between datagrams
+            while not queue.empty():
+                data, addr = queue.get_nowait()
+                self._handle_datagram_received(data, addr)
     
-    async def _handle_datagram_received(self, data: bytes, addr: Tuple) -> None:
-        """Handle the received datagram asynchronously."""
+    def _handle_datagram_received(self, data: bytes, addr: Tuple) -> None:
+        """Handle a received datagram."""
         try:
-            # Log the raw data for debugging
+            message = self._parse_datagram(data, addr)
+            if message:
+                self._dispatch_message(message, addr)
+        except Exception:
+            self._logger.exception("Error handling message")
+    
+    def _parse_datagram(
+        self, data: bytes, addr: Tuple
+    ) -> Optional[Union[GoveeDevice, DeviceStatus]]:
+        """Parse a received datagram into a response message."""
+        # Log the raw data for debugging, decoding it only when it will be shown
+        if self._logger.isEnabledFor(logging.DEBUG):
             try:
                 json_str = data.decode("utf-8")
-                self._logger.debug(f"Raw data from {addr}: {json_str[:200]}")
-            except:
-                self._logger.debug(f"Non-text data received from {addr}")
-            
-            message = self._message_factory.create_message(data)
-            if not message:
-                self._logger.debug(f"Message factory couldn't parse data from {addr}. First 100 bytes: {data[:100]}")
-                return
-            
-            if isinstance(message, GoveeDevice):
-                self._logger.debug(f"Device info message received from {addr}: {message.device_id}")
-                await self._handle_scan_response(message)
-            elif isinstance(message, DeviceStatus):
-                self._logger.debug(f"Status update message received from {addr}")
-                await self._handle_status_update_response(message, addr)
-            else:
-                self._logger.debug(f"Unknown message type received: {type(message)}")
-        except Exception as ex:
-            self._logger.error(f"Error handling message: {ex}")
-            import traceback
-            self._logger.error(traceback.format_exc())
+                self._logger.debug("Raw data from %s: %s", addr, json_str[:200])
+            except UnicodeDecodeError:
+                self._logger.debug("Non-text data received from %s", addr)
+        
+        message = self._message_factory.create_message(data)
+        if not message:
+            self._logger.debug(
+                "Message factory couldn't parse data from %s. First 100 bytes: %s",
+                addr,
+                data[:100],
+            )
+        return message
+    
+    def _dispatch_message(
+        self, message: Union[GoveeDevice, DeviceStatus], addr: Tuple
+    ) -> None:
+        """Dispatch a parsed response message to its handler."""
+        handler = self._message_handlers.get(type(message))
+        if handler is None:
+            self._logger.debug("Unknown message type received: %s", type(message))
+            return
+        handler(message, addr)
     
-    async def _handle_status_update_response(self, message: DeviceStatus, addr: Tuple) -> None:
+    def _handle_status_update_response(self, message: DeviceStatus, addr: Tuple) -> None:
         """Handle a status update response."""
         ip = addr[0]
         device = self.get_device_by_ip(ip)
         
         if device:
             self._logger.debug(
-                f"Status update from {device}: on={message.on}, "
-                f"brightness={message.brightness}, "
-                f"color=({message.color.r},{message.color.g},{message.color.b}), "
-                f"temp={message.color_temperature_kelvin}"
+                "Status update from %s: on=%s, brightness=%s, color=(%s,%s,%s), temp=%s",
+                device,
+                message.on,
+                message.brightness,
+                message.color.r,
+                message.color.g,
+                message.color.b,
+                message.color_temperature_kelvin,
             )
             
             device.update(message)
+            self._devices.move_to_end(device.fingerprint)
             
             # Check if we're waiting for a state verification on this device
             device_key = device.fingerprint
@@ -808,31 +1013,42 @@ class GoveeController:
                 event, verify_callback = self._state_verification_events[device_key]
                 # Check if the new state matches what we're waiting for
                 if verify_callback(device):
-                    self._logger.debug(f"Device {device} reached desired state")
+                    self._logger.debug("Device %s reached desired state", device)
+                    # Release the registration right away so later status
+                    # replies skip verification
+                    del self._state_verification_events[device_key]
                     event.set()
     
-    async def _handle_scan_response(self, device_info: GoveeDevice) -> None:
+    def _handle_scan_response(self, device_info: GoveeDevice, addr: Tuple) -> None:
         """Handle a scan response."""
         if not device_info.device_id:
             self._logger.warning("Received device info with empty device_id")
             return
             
         fingerprint = device_info.device_id
-        self._logger.debug(f"Processing scan response for device with ID: {fingerprint}")
+        self._logger.debug("Processing scan response for device with ID: %s", fingerprint)
         device = self.get_device_by_fingerprint(fingerprint)
         
         if device:
             # Update existing device's IP if it changed
             if device.ip != device_info.ip and device_info.ip != "unknown":
-                self._logger.info(f"Device {fingerprint} IP changed from {device.ip} to {device_info.ip}")
-                device._ip = device_info.ip
+                self._logger.info("Device %s IP changed from %s to %s", fingerprint, device.ip, device_info.ip)
+                self._remove_from_index(device)
+                device._set_ip(device_info.ip)
+                self._devices_by_ip[device.ip] = device
             
             if self._call_discovered_callback(device, False):
                 device.update_lastseen()
-                self._logger.debug(f"Device updated: {device}")
+                self._devices.move_to_end(fingerprint)
+                self._logger.debug("Device updated: %s", device)
         else:
             # Create a new device
-            self._logger.info(f"Creating new device: ID={device_info.device_id}, Model={device_info.model}, IP={device_info.ip}")
+            self._logger.info(
+                "Creating new device: ID=%s, Model=%s, IP=%s",
+                device_info.device_id,
+                device_info.model,
+                device_info.ip,
+            )
             device = GoveeLocalDevice(
                 controller=self,
                 ip=device_info.ip,
@@ -846,46 +1062,49 @@ class GoveeController:
             
             if self._call_discovered_callback(device, True):
                 self._devices[fingerprint] = device
-                self._logger.info(f"Device discovered: {device}")
+                self._devices_by_ip[device.ip] = device
+                self._logger.info("Device discovered: %s", device)
             else:
-                self._logger.debug(f"Device {device} ignored by callback")
+                self._logger.debug("Device %s ignored by callback", device)
         
         # Evict old devices if enabled
         if self._evict_enabled:
             self._evict()
     
-    def _call_discovered_callback(self, device: GoveeLocalDevice, is_new: bool) -> bool:
-        """Call the discovered callback and return the result."""
-        if not self._device_discovered_callback:
-            return True
-        return self._device_discovered_callback(device, is_new)
+    def _remove_from_index(self, device: GoveeLocalDevice) -> None:
+        """Remove a device from the IP index if it still owns its address."""
+        if self._devices_by_ip.get(device.ip) is device:
+            del self._devices_by_ip[device.ip]
     
     def _send_message(self, message: GoveeMessage, device: GoveeLocalDevice) -> None:
         """Send a message to a device."""
-        self._transport.sendto(
-            message.to_bytes(),
-            (device.ip, self._device_command_port)
-        )
+        self._transport.sendto(message.to_bytes(), device._command_address)
     
     def _send_update_message(self, device: GoveeLocalDevice) -> None:
         """Send an update message to a device."""
-        self._send_message(DevStatusMessage(), device)
+        self._transport.sendto(STATUS_REQUEST_PAYLOAD, device._command_address)
     
     def _evict(self) -> None:
         """Evict devices that haven't been seen for a while."""
-        now = datetime.now()
+        now = self._loop_time()
+        # Scan replies arrive in bursts, check at most a few times per interval
+        if now - self._last_evict_time < min(self._evict_interval / 4, 30):
+            return
+        self._last_evict_time = now
         devices_to_evict = []
         
         for fingerprint, device in self._devices.items():
-            diff = now - device.lastseen
-            if diff.total_seconds() >= self._evict_interval:
-                devices_to_evict.append(fingerprint)
+            if now - device._lastseen < self._evict_interval:
+                # Every later device was seen more recently
+                break
+            devices_to_evict.append(fingerprint)
         
         for fingerprint in devices_to_evict:
             device = self._devices[fingerprint]
             device._controller = None
             del self._devices[fingerprint]
+            self._remove_from_index(device)
             
-            self._logger.debug(f"Device evicted: {device}")
+            self._logger.debug("Device evicted: %s", device)
             if self._device_evicted_callback:
                 self._device_evicted_callback(device)
\ No newline at end of file
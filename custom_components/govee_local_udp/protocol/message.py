@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import ClassVar, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Union
 
 from dataclasses import dataclass
 from enum import IntEnum
 
+try:
+    # orjson ships with Home Assistant, it parses bytes without decoding first
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 MSG_SCAN = "scan"
@@ -27,7 +37,7 @@ class GoveeLightFeatures(IntEnum):
     COLOR_KELVIN_TEMPERATURE = 4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GoveeMessage:
     """Base class for all Govee messages."""
 
@@ -35,15 +45,14 @@ class GoveeMessage:
     
     def to_bytes(self) -> bytes:
         """Convert the message to bytes to be sent over the network."""
-        msg_dict = {"msg": {"cmd": self.command, "data": self.to_dict()}}
-        return json.dumps(msg_dict).encode("utf-8")
+        return _json_dumps({"msg": {"cmd": self.command, "data": self.to_dict()}})
         
     def to_dict(self) -> dict:
         """Convert message to dict format."""
         return {}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScanMessage(GoveeMessage):
     """Scan for devices on the network."""
 
@@ -54,38 +63,43 @@ class ScanMessage(GoveeMessage):
         return {"account_topic": "reserve"}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DevStatusMessage(GoveeMessage):
     """Request device status."""
 
     command: ClassVar[str] = MSG_STATUS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OnOffMessage(GoveeMessage):
     """Turn the device on or off."""
 
     command: ClassVar[str] = MSG_TURN
     on: bool
     
-    def to_dict(self) -> dict:
-        """Convert message to dict format."""
-        return {"value": 1 if self.on else 0}
+    def to_bytes(self) -> bytes:
+        """Convert the message to bytes to be sent over the network."""
+        return _TURN_ON_BYTES if self.on else _TURN_OFF_BYTES
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrightnessMessage(GoveeMessage):
     """Set the brightness of the device."""
 
     command: ClassVar[str] = MSG_BRIGHTNESS
     value: int
     
-    def to_dict(self) -> dict:
-        """Convert message to dict format."""
-        return {"value": self.value}
+    def __post_init__(self) -> None:
+        """Validate the brightness before it is written into the payload."""
+        if not 0 <= self.value <= 100:
+            raise ValueError(f"Brightness must be between 0 and 100, got {self.value}")
+    
+    def to_bytes(self) -> bytes:
+        """Convert the message to bytes to be sent over the network."""
+        return b'{"msg":{"cmd":"brightness","data":{"value":%d}}}' % self.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorMessage(GoveeMessage):
     """Set the color of the device."""
 
@@ -93,28 +107,35 @@ class ColorMessage(GoveeMessage):
     rgb: Optional[Tuple[int, int, int]] = None
     temperature: Optional[int] = None
     
-    def to_dict(self) -> dict:
-        """Convert message to dict format."""
+    def __post_init__(self) -> None:
+        """Validate the color before it is written into the payload."""
         if self.rgb is not None:
-            r, g, b = self.rgb
-            return {
-                "color": {"r": r, "g": g, "b": b},
-                "colorTemInKelvin": 0,
-            }
-        else:
-            return {
-                "color": {"r": 0, "g": 0, "b": 0},
-                "colorTemInKelvin": self.temperature or 0,
-            }
-
-
+            if len(self.rgb) != 3 or not all(0 <= c <= 255 for c in self.rgb):
+                raise ValueError(f"RGB color must be three values between 0 and 255, got {self.rgb}")
+        elif self.temperature and not 0 <= self.temperature <= 10000:
+            raise ValueError(f"Color temperature must be between 0 and 10000, got {self.temperature}")
+    
+    def to_bytes(self) -> bytes:
+        """Convert the message to bytes to be sent over the network."""
+        if self.rgb is not None:
+            return (
+                b'{"msg":{"cmd":"colorwc","data":{"color":{"r":%d,"g":%d,"b":%d},"colorTemInKelvin":0}}}'
+                % self.rgb
+            )
+        return (
+            b'{"msg":{"cmd":"colorwc","data":{"color":{"r":0,"g":0,"b":0},"colorTemInKelvin":%d}}}'
+            % (self.temperature or 0)
+        )
 
 
+# On/off payloads, the turn command has no other parameters
+_TURN_ON_BYTES = b'{"msg":{"cmd":"turn","data":{"value":1}}}'
+_TURN_OFF_BYTES = b'{"msg":{"cmd":"turn","data":{"value":0}}}'
 
 
 # Response objects
 
-@dataclass
+@dataclass(slots=True)
 class DeviceColor:
     """RGB color of a device."""
 
@@ -123,7 +144,7 @@ class DeviceColor:
     b: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceStatus:
     """Device status response."""
 
@@ -133,7 +154,7 @@ class DeviceStatus:
     color_temperature_kelvin: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GoveeDevice:
     """Information about a Govee device."""
 
@@ -146,15 +167,89 @@ class GoveeDevice:
     wifi_software_version: str
 
 
+def _parse_scan_response(msg_data: dict) -> Optional[GoveeDevice]:
+    """Parse the data of a scan response (device discovery)."""
+    get = msg_data.get
+    # The device field can be either a string (device ID) or an object
+    device_field = get("device")
+    ip = get("ip", "unknown")
+    device_id = ""
+    sku = ""
+    
+    # If device is a string, it's likely the device ID
+    if isinstance(device_field, str):
+        device_id = device_field
+        _LOGGER.debug("Device ID from string: %s", device_id)
+        # Get SKU (model) from main data object
+        sku = get("sku", "")
+    elif isinstance(device_field, dict):
+        # Otherwise it's an object with a deviceId field
+        device_id = device_field.get("deviceId", "")
+        _LOGGER.debug("Device ID from object: %s", device_id)
+        # Try to get SKU from device object first
+        sku = device_field.get("sku", "")
+    
+    # If we still don't have a device ID, try finding it in the main data
+    if not device_id and "deviceId" in msg_data:
+        device_id = msg_data["deviceId"]
+    
+    # If we still don't have a SKU, try the main data
+    if not sku and "sku" in msg_data:
+        sku = msg_data["sku"]
+    
+    _LOGGER.debug("Found device: ID=%s, SKU=%s, IP=%s", device_id, sku, ip)
+    
+    # Hardware/software versions
+    ble_hw = get("bleVersionHard", "")
+    ble_sw = get("bleVersionSoft", "")
+    wifi_hw = get("wifiVersionHard", "")
+    wifi_sw = get("wifiVersionSoft", "")
+    
+    if not device_id:
+        _LOGGER.warning("Could not extract device ID from message: %s", msg_data)
+        return None
+    
+    return GoveeDevice(
+        ip=ip,
+        device_id=device_id,
+        model=sku,
+        ble_hardware_version=ble_hw,
+        ble_software_version=ble_sw,
+        wifi_hardware_version=wifi_hw,
+        wifi_software_version=wifi_sw,
+    )
+
+
+def _parse_status_response(msg_data: dict) -> DeviceStatus:
+    """Parse the data of a status response."""
+    get = msg_data.get
+    color_get = get("color", {}).get
+    return DeviceStatus(
+        on=get("onOff", 0) == 1,
+        brightness=get("brightness", 0),
+        color=DeviceColor(
+            r=color_get("r", 0),
+            g=color_get("g", 0),
+            b=color_get("b", 0),
+        ),
+        color_temperature_kelvin=get("colorTemInKelvin", 0),
+    )
+
+
+# Response parsers by command, responses to other commands are ignored
+_HANDLERS: Dict[str, Callable[[dict], Optional[Union[GoveeDevice, DeviceStatus]]]] = {
+    MSG_SCAN: _parse_scan_response,
+    MSG_STATUS: _parse_status_response,
+}
+
+
 class MessageResponseFactory:
     """Factory for creating response messages."""
 
     def create_message(self, data: bytes) -> Optional[Union[GoveeDevice, DeviceStatus]]:
         """Parse response data and create the appropriate message object."""
         try:
-            json_str = data.decode("utf-8")
-            _LOGGER.debug(f"Received message: {json_str[:200]}")
-            json_data = json.loads(json_str)
+            json_data = _json_loads(data)
             
             # Check if it's a valid message format
             if not json_data.get("msg"):
@@ -162,81 +257,22 @@ class MessageResponseFactory:
                 return None
                 
             msg = json_data["msg"]
-            cmd = msg.get("cmd")
-            msg_data = msg.get("data", {})
+            try:
+                cmd = msg["cmd"]
+                msg_data = msg["data"]
+            except KeyError:
+                cmd = msg_data = None
             
             if not cmd or not msg_data:
-                _LOGGER.warning(f"Invalid message format, missing 'cmd' or 'data' field: {json_data}")
+                _LOGGER.warning("Invalid message format, missing 'cmd' or 'data' field: %s", json_data)
                 return None
             
-            # First, try to handle scan responses (device discovery)
-            if cmd == MSG_SCAN:
-                # The device field can be either a string (device ID) or an object
-                device_field = msg_data.get("device")
-                ip = msg_data.get("ip", "unknown")
-                device_id = ""
-                sku = ""
-                
-                # If device is a string, it's likely the device ID
-                if isinstance(device_field, str):
-                    device_id = device_field
-                    _LOGGER.debug(f"Device ID from string: {device_id}")
-                    # Get SKU (model) from main data object
-                    sku = msg_data.get("sku", "")
-                elif isinstance(device_field, dict):
-                    # Otherwise it's an object with a deviceId field
-                    device_id = device_field.get("deviceId", "")
-                    _LOGGER.debug(f"Device ID from object: {device_id}")
-                    # Try to get SKU from device object first
-                    sku = device_field.get("sku", "")
-                
-                # If we still don't have a device ID, try finding it in the main data
-                if not device_id and "deviceId" in msg_data:
-                    device_id = msg_data["deviceId"]
-                
-                # If we still don't have a SKU, try the main data
-                if not sku and "sku" in msg_data:
-                    sku = msg_data["sku"]
-                
-                _LOGGER.debug(f"Found device: ID={device_id}, SKU={sku}, IP={ip}")
-                
-                # Hardware/software versions
-                ble_hw = msg_data.get("bleVersionHard", "")
-                ble_sw = msg_data.get("bleVersionSoft", "")
-                wifi_hw = msg_data.get("wifiVersionHard", "")
-                wifi_sw = msg_data.get("wifiVersionSoft", "")
-                
-                if not device_id:
-                    _LOGGER.warning(f"Could not extract device ID from message: {json_str[:200]}")
-                    return None
-                
-                return GoveeDevice(
-                    ip=ip,
-                    device_id=device_id,
-                    model=sku,
-                    ble_hardware_version=ble_hw,
-                    ble_software_version=ble_sw,
-                    wifi_hardware_version=wifi_hw,
-                    wifi_software_version=wifi_sw,
-                )
-            # Handle status responses
-            elif cmd == MSG_STATUS:
-                color_data = msg_data.get("color", {})
-                brightness_value = msg_data.get("brightness", 0)
-                return DeviceStatus(
-                    on=msg_data.get("onOff", 0) == 1,
-                    brightness=brightness_value,
-                    color=DeviceColor(
-                        r=color_data.get("r", 0),
-                        g=color_data.get("g", 0),
-                        b=color_data.get("b", 0),
-                    ),
-                    color_temperature_kelvin=msg_data.get("colorTemInKelvin", 0),
-                )
+            handler = _HANDLERS.get(cmd)
+            return handler(msg_data) if handler else None
                 
         except json.JSONDecodeError as ex:
-            _LOGGER.warning(f"Failed to decode JSON: {ex}")
+            _LOGGER.warning("Failed to decode JSON: %s", ex)
         except Exception as ex:
-            _LOGGER.warning(f"Error parsing message: {ex}, data: {data[:200]}")
+            _LOGGER.warning("Error parsing message: %s, data: %s", ex, data[:200])
             
         return None